@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Pending Issues Check - UserPromptSubmit Hook
+Checks for pending GitHub issues and injects reminder into Claude context.
+Invoked by pending-issues-check.sh only when the queue is non-empty.
+
+FLOW:
+1. Check pending-issues.jsonl
+2. If issues exist, inject reminder with full context
+3. Claude automatically creates GitHub issues via MCP
+4. Clear queue after creation
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.getcwd()
+PENDING_ISSUES_FILE = f"{PROJECT_ROOT}/.memories/issue-tracking/pending-issues.jsonl"
+LEGACY_PENDING_ISSUES_FILE = f"{PROJECT_ROOT}/.memories/issue-tracking/pending-issues.json"
+
+def migrate_legacy_queue():
+    """Move issues from the pre-JSONL pending-issues.json array into the queue."""
+    if not os.path.exists(LEGACY_PENDING_ISSUES_FILE):
+        return
+
+    import json
+    import fcntl
+
+    try:
+        with open(LEGACY_PENDING_ISSUES_FILE, 'r', encoding='utf-8') as f:
+            issues = json.load(f)
+    except ValueError:
+        issues = []  # Unreadable legacy queue - nothing to carry over
+
+    lines = ''.join(
+        json.dumps(issue, separators=(',', ':'), ensure_ascii=False) + '\n'
+        for issue in issues
+    )
+
+    with open(PENDING_ISSUES_FILE, 'a', encoding='utf-8') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write(lines)
+            f.flush()
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+    os.remove(LEGACY_PENDING_ISSUES_FILE)
+
+def load_pending_issues():
+    """Load pending issues queue."""
+    try:
+        migrate_legacy_queue()
+    except OSError:
+        pass  # Leave the legacy queue for the next attempt
+
+    try:
+        if not os.stat(PENDING_ISSUES_FILE).st_size:
+            return []
+    except OSError:
+        return []
+
+    # Imported only once there is a queue to parse - the common
+    # no-pending-issues path exits without loading a JSON parser
+    try:
+        from orjson import loads  # Optional: faster parsing of the queue
+    except ImportError:
+        from json import loads
+
+    issues = []
+
+    try:
+        with open(PENDING_ISSUES_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    issue = loads(line)
+                except ValueError:
+                    continue  # Blank or corrupt line - keep the rest of the queue
+                if isinstance(issue, dict):
+                    issues.append(issue)
+    except OSError:
+        return []
+
+    return issues
+
+def format_issue_context(issue):
+    """Format issue for Claude context."""
+    severity_emoji = {
+        'critical': '🔴',
+        'high': '🟠',
+        'medium': '🟡',
+        'low': '🟢'
+    }.get(issue['severity'], '⚪')
+
+    return f"""
+{severity_emoji} **{issue['category'].replace('-', ' ').title()}** in `{issue['file']}`
+- Severity: {issue['severity']}
+- Detected: {issue['detected_at']}
+- Error: {issue['error_message'][:200]}...
+"""
+
+def main():
+    """Check for pending issues and inject into context."""
+    pending = load_pending_issues()
+
+    if not pending:
+        sys.exit(0)  # No pending issues
+
+    # Inject reminder into Claude context
+    reminder = f"""
+<system-reminder>
+⚠️ **PENDING GITHUB ISSUES DETECTED** ({len(pending)} issues)
+
+The following errors were detected and queued for GitHub issue creation:
+
+{''.join(format_issue_context(issue) for issue in pending)}
+
+**ACTION REQUIRED**:
+Use `mcp__github__create_issue` to create these issues, then clear the queue by deleting `{PENDING_ISSUES_FILE}`
+
+**Queue Location**: `{PENDING_ISSUES_FILE}`
+</system-reminder>
+"""
+
+    print(reminder)
+    sys.exit(0)
+
+if __name__ == '__main__':
+    main()
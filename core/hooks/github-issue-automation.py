@@ -4,53 +4,218 @@ GitHub Issue Automation - PostToolUse Integration
 Detects errors and queues them for GitHub issue creation via MCP.
 
 ARCHITECTURE:
-1. PostToolUse: Detect error → Queue to pending-issues.json
+1. PostToolUse: Detect error → Append to pending-issues.jsonl
 2. UserPromptSubmit: Check queue → Inject into Claude context
 3. Claude: Read queue → Create issues via mcp__github__create_issue
+
+Usually runs inside pingmem-hookd.py (via pingmem-hook-client.sh); run
+directly, it handles the event from CLAUDE_HOOK_INPUT itself.
 """
 
 import os
 import sys
 import json
-from pathlib import Path
-from datetime import datetime
+import time
+import fcntl
+
+try:
+    import re2 as re  # Optional: linear-time DFA matching, no backtracking
+except ImportError:
+    import re
 
 PROJECT_ROOT = os.getcwd()
-MEMORIES_DIR = os.path.join(PROJECT_ROOT, '.memories')
-ISSUE_TRACKING_DIR = os.path.join(MEMORIES_DIR, 'issue-tracking')
-PENDING_ISSUES_FILE = os.path.join(ISSUE_TRACKING_DIR, 'pending-issues.json')
-CONFIG_FILE = os.path.join(ISSUE_TRACKING_DIR, 'config.json')
+MEMORIES_DIR = f"{PROJECT_ROOT}/.memories"
+ISSUE_TRACKING_DIR = f"{MEMORIES_DIR}/issue-tracking"
+PENDING_ISSUES_FILE = f"{ISSUE_TRACKING_DIR}/pending-issues.jsonl"
+PENDING_SEEN_FILE = f"{ISSUE_TRACKING_DIR}/pending-issues.seen"
+LEGACY_PENDING_ISSUES_FILE = f"{ISSUE_TRACKING_DIR}/pending-issues.json"
+CONFIG_FILE = f"{ISSUE_TRACKING_DIR}/config.json"
+LOGS_DIR = f"{ISSUE_TRACKING_DIR}/logs"
+ISSUES_DIR = f"{ISSUE_TRACKING_DIR}/issues"
+DETECTIONS_LOG = f"{LOGS_DIR}/detections.log"
+
+# Compiled once at import - this hook runs after every tool call.
+# One scan both detects and classifies: each named group is a term the
+# old detection/classification patterns looked for. Flags are inline so
+# the pattern compiles the same under re and re2.
+_ERROR_RE = re.compile(
+    r'(?P<ts_code>TS\d+)'
+    r'|(?P<code>(?i:ts\d+))'
+    r'|(?P<type_error>(?i:typ(?:error|exception)))'
+    r'|(?P<type>TS|(?i:type))'
+    r'|(?P<syntax>(?i:syntax))'
+    r'|(?P<runtime>(?i:exception|fatal))'
+    r'|(?P<error>(?i:error|fail))'
+)
+
+# Named group -> (category it implies, whether it marks a real error).
+# A bare "TS" or "type" classifies an error but doesn't signal one.
+_ERROR_GROUPS = {
+    'ts_code': ('type', True),
+    'code': (None, True),
+    'type_error': ('type', True),  # "type" sharing its "e" with an error term
+    'type': ('type', False),
+    'syntax': ('syntax', False),
+    'runtime': ('runtime', True),
+    'error': (None, True),
+}
+
+# Category -> (category, severity), highest priority first
+_CATEGORIES = {
+    'type': ('type-error', 'high'),
+    'syntax': ('syntax-error', 'high'),
+    'runtime': ('runtime-error', 'critical'),
+}
+_CATEGORY_RANK = {name: rank for rank, name in enumerate(_CATEGORIES)}
+
+# Tools whose failures aren't worth filing as issues
+_READ_ONLY_TOOLS = frozenset({'Read', 'Glob', 'Grep'})
+
+# Shortest text that can contain an error term ("TS1" via ts\d+)
+MIN_ERROR_LENGTH = 3
+
+# Only the head of the output is scanned; error signatures appear early
+SCAN_LIMIT = 4000
+
+# Parsed config, invalidated when config.json's mtime changes
+_CONFIG_CACHE = {'mtime': None, 'data': None}
 
 def ensure_directories():
     """Ensure issue tracking directories exist."""
     os.makedirs(ISSUE_TRACKING_DIR, exist_ok=True)
-    os.makedirs(os.path.join(ISSUE_TRACKING_DIR, 'logs'), exist_ok=True)
-    os.makedirs(os.path.join(ISSUE_TRACKING_DIR, 'issues'), exist_ok=True)
+    os.makedirs(LOGS_DIR, exist_ok=True)
+    os.makedirs(ISSUES_DIR, exist_ok=True)
 
 def load_config():
-    """Load issue tracking configuration."""
-    if not os.path.exists(CONFIG_FILE):
+    """Load issue tracking configuration (cached by mtime)."""
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
         return None
 
+    if _CONFIG_CACHE['mtime'] == mtime:
+        return _CONFIG_CACHE['data']
+
     with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+        data = json.load(f)
+
+    _CONFIG_CACHE['mtime'] = mtime
+    _CONFIG_CACHE['data'] = data
+    return data
 
 def load_pending_issues():
-    """Load pending issues queue."""
-    if not os.path.exists(PENDING_ISSUES_FILE):
+    """Load pending issues queue (JSON Lines, one issue per line).
+
+    Undecodable lines - a hook killed mid-append, a hand edit - are skipped
+    so they don't take the rest of the queue with them.
+    """
+    issues = []
+
+    try:
+        with open(PENDING_ISSUES_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    issue = json.loads(line)
+                except ValueError:
+                    continue  # Blank or corrupt line
+                if isinstance(issue, dict):
+                    issues.append(issue)
+    except FileNotFoundError:
         return []
 
-    with open(PENDING_ISSUES_FILE, 'r') as f:
-        return json.load(f)
+    return issues
 
-def save_pending_issues(issues):
-    """Save pending issues queue."""
+def append_pending_issue(issue):
+    """Append one issue to the pending queue without rewriting it."""
     ensure_directories()
-    with open(PENDING_ISSUES_FILE, 'w') as f:
-        json.dump(issues, f, indent=2)
+    line = json.dumps(issue, separators=(',', ':'), ensure_ascii=False) + '\n'
+
+    with open(PENDING_ISSUES_FILE, 'a', encoding='utf-8') as f:
+        # Concurrent hook invocations may append at the same time
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write(line)
+            f.flush()
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def migrate_legacy_queue():
+    """Move issues from the pre-JSONL pending-issues.json array into the queue."""
+    if not os.path.exists(LEGACY_PENDING_ISSUES_FILE):
+        return
+
+    try:
+        with open(LEGACY_PENDING_ISSUES_FILE, 'r', encoding='utf-8') as f:
+            issues = json.load(f)
+    except ValueError:
+        issues = []  # Unreadable legacy queue - nothing to carry over
+
+    for issue in issues:
+        append_pending_issue(issue)
+
+    os.remove(LEGACY_PENDING_ISSUES_FILE)
+
+def load_seen_keys():
+    """Load (file, category) keys of the issues currently queued.
+
+    The .seen sidecar's first line records the queue size it was written
+    for. If the queue has since been truncated, consumed or appended to
+    elsewhere, the keys are rebuilt from the queue itself.
+    """
+    try:
+        queue_size = os.stat(PENDING_ISSUES_FILE).st_size
+    except FileNotFoundError:
+        return set()  # Queue was cleared
+
+    if not queue_size:
+        return set()
+
+    try:
+        with open(PENDING_SEEN_FILE, 'r', encoding='utf-8') as f:
+            if f.readline().rstrip('\n') == str(queue_size):
+                # Categories never contain tabs; file paths might
+                return {tuple(line.rstrip('\n').rsplit('\t', 1)) for line in f}
+    except FileNotFoundError:
+        pass
+
+    # Missing or out-of-date sidecar
+    return {(e.get('file'), e.get('category')) for e in load_pending_issues()}
+
+def save_seen_keys(seen):
+    """Rewrite the .seen sidecar for the queue as it is now."""
+    queue_size = os.stat(PENDING_ISSUES_FILE).st_size
+
+    with open(PENDING_SEEN_FILE, 'w', encoding='utf-8') as f:
+        f.write(f"{queue_size}\n" + ''.join(f"{file}\t{category}\n" for file, category in seen))
+
+def classify_error(error_text):
+    """Classify error text into (category, severity), or None if not an error."""
+    detected = False
+    best = None
+
+    for match in _ERROR_RE.finditer(error_text):
+        category, signals_error = _ERROR_GROUPS[match.lastgroup]
+        detected = detected or signals_error
+
+        if category and (best is None or _CATEGORY_RANK[category] < _CATEGORY_RANK[best]):
+            best = category
+
+        if detected and best == 'type':
+            break  # Highest priority, no need to scan further
+
+    if not detected:
+        return None
+
+    if best is None:
+        return 'unknown-error', 'medium'
+
+    return _CATEGORIES[best]
 
 def detect_error(tool_name, args, result):
     """Detect if tool result contains an error."""
+    if not result:
+        return None
+
     # Check for error in result
     error_text = None
 
@@ -59,19 +224,15 @@ def detect_error(tool_name, args, result):
     elif isinstance(result, str):
         error_text = result
 
-    if not error_text:
+    if not error_text or len(error_text) < MIN_ERROR_LENGTH:
         return None
 
-    # Check if it's a real error (avoid false positives)
-    error_patterns = [
-        r'error', r'Error', r'ERROR',
-        r'FAIL', r'Failed', r'Exception',
-        r'Fatal', r'TS\d+',  # TypeScript errors
-        r'SyntaxError', r'TypeError', r'ReferenceError'
-    ]
+    # Truncate before scanning - a verbose build log can be megabytes
+    error_text = error_text[:SCAN_LIMIT]
 
-    import re
-    if not any(re.search(pattern, error_text) for pattern in error_patterns):
+    # Check if it's a real error (avoid false positives)
+    classification = classify_error(error_text)
+    if classification is None:
         return None
 
     # Extract file path
@@ -82,19 +243,7 @@ def detect_error(tool_name, args, result):
         'unknown'
     )
 
-    # Classify error
-    severity = 'medium'
-    category = 'unknown-error'
-
-    if 'TS' in error_text or 'type' in error_text.lower():
-        category = 'type-error'
-        severity = 'high'
-    elif 'syntax' in error_text.lower():
-        category = 'syntax-error'
-        severity = 'high'
-    elif 'exception' in error_text.lower() or 'fatal' in error_text.lower():
-        category = 'runtime-error'
-        severity = 'critical'
+    category, severity = classification
 
     return {
         'error_message': error_text[:1000],  # Limit length
@@ -102,7 +251,7 @@ def detect_error(tool_name, args, result):
         'file': file_path,
         'severity': severity,
         'category': category,
-        'detected_at': datetime.utcnow().isoformat() + 'Z',
+        'detected_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
         'tool': tool_name
     }
 
@@ -123,42 +272,53 @@ def queue_issue(error_context):
     if error_severity_idx < threshold_idx:
         return  # Below threshold
 
-    # Load pending issues
-    pending = load_pending_issues()
+    # Issues queued before the JSON Lines format
+    migrate_legacy_queue()
 
     # Check for duplicates (same file + similar error)
-    for existing in pending:
-        if (existing.get('file') == error_context['file'] and
-            existing.get('category') == error_context['category']):
-            return  # Already queued
+    seen = load_seen_keys()
+    key = (error_context['file'], error_context['category'])
+
+    if key in seen:
+        return  # Already queued
 
     # Add to queue
-    pending.append(error_context)
-    save_pending_issues(pending)
+    append_pending_issue(error_context)
+    seen.add(key)
+    save_seen_keys(seen)
 
-    # Log detection
-    log_file = os.path.join(ISSUE_TRACKING_DIR, 'logs', 'detections.log')
+    # Log detection - one raw O_APPEND write, atomic for lines under PIPE_BUF
     log_entry = f"{error_context['detected_at']} | {error_context['severity']} | {error_context['category']} | {error_context['file']}\n"
 
-    with open(log_file, 'a') as f:
-        f.write(log_entry)
+    fd = os.open(DETECTIONS_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, log_entry.encode())
+    finally:
+        os.close(fd)
+
+def handle_hook_input(hook_input):
+    """Detect and queue an error from one PostToolUse hook input."""
+    tool_data = hook_input.get('tool', {})
+    tool_name = tool_data.get('name', 'unknown')
+    tool_args = tool_data.get('args', {})
+    tool_result = hook_input.get('result', {})
+
+    # Nothing to inspect for empty results or read-only tools
+    if not tool_result or tool_name in _READ_ONLY_TOOLS:
+        return
+
+    # Detect error
+    error_context = detect_error(tool_name, tool_args, tool_result)
+
+    if error_context:
+        queue_issue(error_context)
 
 def main():
     """Main hook handler for PostToolUse."""
     try:
         # Get hook input from Claude Code
         hook_input = json.loads(os.environ.get('CLAUDE_HOOK_INPUT', '{}'))
-
-        tool_data = hook_input.get('tool', {})
-        tool_name = tool_data.get('name', 'unknown')
-        tool_args = tool_data.get('args', {})
-        tool_result = hook_input.get('result', {})
-
-        # Detect error
-        error_context = detect_error(tool_name, tool_args, tool_result)
-
-        if error_context:
-            queue_issue(error_context)
+        handle_hook_input(hook_input)
 
         # Silent success
         sys.exit(0)
@@ -3,54 +3,92 @@
 Memory Update Hook - PostToolUse Wrapper
 Auto-updates memory system after EVERY file write/edit operation.
 Wraps the memory-update-hook.js for Claude Code hook integration.
+
+Registered through pingmem-hook-client.sh, which hands updates to
+pingmem-hookd.py so no node process is spawned per edit. This script
+runs only when the daemon isn't listening, and updates the file directly.
+The daemon reuses extract_update() and find_hook_script() from here.
 """
 
 import os
+import re
 import sys
 import json
 import subprocess
-from pathlib import Path
+
+# Paths the memory system never tracks - skip the node spawn for these
+_IGNORE_RE = re.compile(
+    r'(?:^|/)(?:node_modules|\.git|\.next|dist|build|__pycache__)/|\.pyc$|\.log$'
+)
+
+# Set to the memory-update-hook.js path to skip probing for it
+HOOK_SCRIPT_ENV = 'PINGMEM_MEMORY_HOOK'
+
+def find_hook_script(project_root):
+    """Locate memory-update-hook.js for this project, or None."""
+    hook_script = os.environ.get(HOOK_SCRIPT_ENV)
+    if hook_script:
+        return hook_script
+
+    hook_script = f"{project_root}/.claude/hooks/memory-update-hook.js"
+
+    if not os.path.isfile(hook_script):
+        # Try parent directory (in case we're in a subdirectory)
+        hook_script = f"{project_root}/../.claude/hooks/memory-update-hook.js"
+
+    if not os.path.isfile(hook_script):
+        return None
+
+    return hook_script
+
+def extract_update(hook_input):
+    """Return (tool_name, file_path) for a tracked file edit, or None."""
+    tool_data = hook_input.get('tool', {})
+    tool_name = tool_data.get('name', 'unknown')
+    tool_args = tool_data.get('args', {})
+
+    # Only proceed for file modification tools
+    if tool_name not in ['Write', 'Edit', 'MultiEdit', 'NotebookEdit']:
+        return None
+
+    # Extract file path from args
+    file_path = (
+        tool_args.get('file_path') or
+        tool_args.get('path') or
+        tool_args.get('notebook_path') or
+        None
+    )
+
+    if not file_path:
+        return None  # No file path, skip
+
+    if _IGNORE_RE.search(file_path):
+        return None  # Untracked location, skip
+
+    return tool_name, file_path
 
 def main():
     """Wrapper that calls memory-update-hook.js with proper arguments."""
 
     try:
         # Get hook input from Claude Code
-        hook_input = json.loads(os.environ.get('CLAUDE_HOOK_INPUT', '{}'))
+        raw_input = os.environ.get('CLAUDE_HOOK_INPUT', '{}')
+        update = extract_update(json.loads(raw_input))
 
-        tool_data = hook_input.get('tool', {})
-        tool_name = tool_data.get('name', 'unknown')
-        tool_args = tool_data.get('args', {})
-        tool_result = hook_input.get('result', {})
-
-        # Only proceed for file modification tools
-        if tool_name not in ['Write', 'Edit', 'MultiEdit', 'NotebookEdit']:
+        if not update:
             sys.exit(0)
 
-        # Extract file path from args
-        file_path = (
-            tool_args.get('file_path') or
-            tool_args.get('path') or
-            tool_args.get('notebook_path') or
-            None
-        )
-
-        if not file_path:
-            sys.exit(0)  # No file path, skip
+        tool_name, file_path = update
 
         # Find the memory update hook script
         project_root = os.getcwd()
-        hook_script = os.path.join(project_root, '.claude', 'hooks', 'memory-update-hook.js')
-
-        if not os.path.isfile(hook_script):
-            # Try parent directory (in case we're in a subdirectory)
-            hook_script = os.path.join(project_root, '..', '.claude', 'hooks', 'memory-update-hook.js')
+        hook_script = find_hook_script(project_root)
 
-        if not os.path.isfile(hook_script):
+        if not hook_script:
             # Silent fail - memory system may not be initialized in this project
             sys.exit(0)
 
-        # Call the memory update hook
+        # Daemon isn't listening - update this file directly
         result = subprocess.run(
             ['node', hook_script, tool_name, file_path],
             cwd=project_root,
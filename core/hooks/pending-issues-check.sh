@@ -0,0 +1,13 @@
+#!/bin/sh
+#
+# Pending Issues Check - UserPromptSubmit Fast Path
+#
+# Runs on every prompt. The queue is almost always absent or empty, so
+# check that in the shell and only start Python when there is something
+# to report.
+#
+
+# pending-issues.json is the pre-JSONL queue, migrated by the Python script
+[ -s .memories/issue-tracking/pending-issues.jsonl ] ||
+    [ -s .memories/issue-tracking/pending-issues.json ] || exit 0
+exec python3 "$(dirname "$0")/_pending-issues-check.py"
@@ -0,0 +1,53 @@
+#!/bin/sh
+#
+# Pingmem Hook Client - PostToolUse Dispatcher
+#
+# Forwards the hook event to pingmem-hookd.py over its UNIX socket, so no
+# Python interpreter starts per tool call. Uses socat when installed, else
+# perl (stock on macOS and Linux); a bare Python client is the last resort.
+# When the daemon isn't listening the hook script runs directly.
+#
+# This is the only place the daemon is started, so a cold event launches
+# exactly one daemon.
+#
+# Usage: pingmem-hook-client.sh <memory-update|github-issue>
+#
+
+HOOKS_DIR="$(dirname "$0")"
+SOCKET="$HOME/.claude/pingmem.sock"
+
+case "$1" in
+    memory-update) SCRIPT="memory-update-posttooluse.py" ;;
+    github-issue) SCRIPT="github-issue-automation.py" ;;
+    *) exit 0 ;;
+esac
+
+# Send one "<hook>\n<project root>\n<CLAUDE_HOOK_INPUT>" event
+send_event() {
+    if command -v socat >/dev/null 2>&1; then
+        printf '%s\n%s\n%s' "$1" "$PWD" "${CLAUDE_HOOK_INPUT:-{\}}" |
+            socat -u - "UNIX-CONNECT:$SOCKET" 2>/dev/null
+    elif command -v perl >/dev/null 2>&1; then
+        perl -MIO::Socket::UNIX -e '
+my $client = IO::Socket::UNIX->new(Peer => $ARGV[0]) or exit 1;
+print $client join("\n", @ARGV[1, 2], $ENV{CLAUDE_HOOK_INPUT} || "{}");
+' "$SOCKET" "$1" "$PWD" 2>/dev/null
+    else
+        python3 -S -c '
+import os, sys, socket
+client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+client.connect(sys.argv[1])
+client.sendall("\n".join(sys.argv[2:4] + [os.environ.get("CLAUDE_HOOK_INPUT") or "{}"]).encode())
+client.close()
+' "$SOCKET" "$1" "$PWD" 2>/dev/null
+    fi
+}
+
+if [ -S "$SOCKET" ] && send_event "$1"; then
+    exit 0
+fi
+
+# Daemon not listening - start it for the next event
+python3 "$HOOKS_DIR/pingmem-hookd.py" </dev/null >/dev/null 2>&1 &
+
+exec python3 "$HOOKS_DIR/$SCRIPT"
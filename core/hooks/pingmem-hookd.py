@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Pingmem Hook Daemon - Shared PostToolUse Handler
+Long-lived process that receives PostToolUse hook events over a UNIX
+socket, so hooks don't pay Python startup and imports on every tool call.
+
+FLOW:
+1. pingmem-hook-client.sh connects to SOCKET_PATH and sends one event: "<hook>\n<project root>\n<CLAUDE_HOOK_INPUT>"
+2. memory-update events are coalesced per file within BATCH_WINDOW and
+   memory-update-hook.js runs once per coalesced file
+3. github-issue events run github-issue-automation.py's handler in-process
+4. Daemon exits after IDLE_TIMEOUT seconds without events, or on a
+   "shutdown" event (sent by install.sh so upgrades take effect)
+
+pending-issues-check stays out of the daemon: its reminder must be printed
+by the hook process itself, and its shell fast path already avoids Python.
+
+Started lazily by pingmem-hook-client.sh when nothing is listening.
+LOCK_PATH keeps concurrent starts down to one daemon owning the socket.
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import select
+import socket
+import subprocess
+import importlib.util
+
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = f"{os.path.expanduser('~')}/.claude/pingmem.sock"
+LOCK_PATH = f"{os.path.expanduser('~')}/.claude/pingmem.lock"
+
+BATCH_WINDOW = 0.1   # Seconds to coalesce updates to the same file
+IDLE_TIMEOUT = 600   # Seconds without events before the daemon exits
+MAX_EVENT_SIZE = 16 * 1024 * 1024
+
+def load_hook(filename, project_root=None):
+    """Import a hook script by filename (hook names contain hyphens).
+
+    Hook scripts resolve their paths from the working directory at import,
+    so project-specific hooks are imported from inside project_root.
+    """
+    path = f"{HOOKS_DIR}/{filename}"
+    spec = importlib.util.spec_from_file_location(filename.replace('-', '_')[:-3], path)
+    module = importlib.util.module_from_spec(spec)
+
+    if project_root:
+        os.chdir(project_root)
+    spec.loader.exec_module(module)
+    return module
+
+memory_hook = load_hook('memory-update-posttooluse.py')
+
+# Project root -> github-issue-automation module bound to that project
+_issue_hooks = {}
+
+def acquire_lock():
+    """Take the daemon lock for this process's lifetime.
+
+    Returns the open lock file, or None if another daemon holds it. The
+    kernel drops the lock when the holder exits, including on a crash.
+    """
+    os.makedirs(os.path.dirname(LOCK_PATH), exist_ok=True)
+    lock = open(LOCK_PATH, 'w')
+
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return None  # Already running or starting
+
+    return lock
+
+def bind_socket():
+    """Bind the daemon socket. Only called while holding the daemon lock."""
+    # Any existing socket belongs to a daemon that crashed
+    try:
+        os.unlink(SOCKET_PATH)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCKET_PATH)
+    os.chmod(SOCKET_PATH, 0o600)
+    server.listen(64)
+    return server
+
+def receive_event(server):
+    """Accept one connection and decode it into (hook, project root, input)."""
+    conn, _ = server.accept()
+    try:
+        conn.settimeout(1)
+        chunks = []
+        size = 0
+        while size < MAX_EVENT_SIZE:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+
+        hook_name, project_root, payload = b''.join(chunks).decode().split('\n', 2)
+        return hook_name, project_root, json.loads(payload or '{}')
+    except (OSError, ValueError):
+        return None
+    finally:
+        conn.close()
+
+def run_update(project_root, tool_name, file_path):
+    """Run memory-update-hook.js for one coalesced file."""
+    hook_script = memory_hook.find_hook_script(project_root)
+    if not hook_script:
+        return
+
+    try:
+        subprocess.run(
+            ['node', hook_script, tool_name, file_path],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        pass  # Memory update is optional
+
+def handle_issue_event(project_root, hook_input):
+    """Run issue detection for one tool result in its project."""
+    if project_root not in _issue_hooks:
+        _issue_hooks[project_root] = load_hook('github-issue-automation.py', project_root)
+    _issue_hooks[project_root].handle_hook_input(hook_input)
+
+def dispatch(pending, event, now):
+    """Handle one decoded event; a bad event must not take down the daemon."""
+    hook_name, project_root, hook_input = event
+
+    try:
+        if hook_name == 'memory-update':
+            update = memory_hook.extract_update(hook_input)
+            if update:
+                tool_name, file_path = update
+                key = (project_root, file_path)
+                first_seen = pending[key][1] if key in pending else now
+                pending[key] = (tool_name, first_seen)
+
+        elif hook_name == 'github-issue':
+            handle_issue_event(project_root, hook_input)
+
+    except Exception:
+        pass  # Silent failure - same contract as the standalone hooks
+
+def flush(pending, now):
+    """Run updates whose batch window has elapsed."""
+    due = [key for key, (_, first_seen) in pending.items() if now - first_seen >= BATCH_WINDOW]
+
+    for key in due:
+        tool_name, _ = pending.pop(key)
+        project_root, file_path = key
+        run_update(project_root, tool_name, file_path)
+
+def serve(server):
+    """Event loop: dispatch events, flush batches, exit when idle."""
+    # (cwd, path) -> (latest tool, first seen)
+    pending = {}
+    last_event = time.monotonic()
+
+    while True:
+        now = time.monotonic()
+
+        if pending:
+            oldest = min(first_seen for _, first_seen in pending.values())
+            timeout = max(0, oldest + BATCH_WINDOW - now)
+        else:
+            timeout = last_event + IDLE_TIMEOUT - now
+            if timeout <= 0:
+                return
+
+        readable, _, _ = select.select([server], [], [], timeout)
+
+        if readable:
+            event = receive_event(server)
+            now = time.monotonic()
+
+            if event and isinstance(event[2], dict):
+                if event[0] == 'shutdown':
+                    # Hook files are being replaced - finish batches and exit
+                    flush(pending, float('inf'))
+                    return
+
+                last_event = now
+                dispatch(pending, event, now)
+
+        flush(pending, time.monotonic())
+
+def main():
+    """Run the daemon until idle."""
+    lock = acquire_lock()
+    if lock is None:
+        sys.exit(0)
+
+    try:
+        server = bind_socket()
+        try:
+            serve(server)
+        finally:
+            server.close()
+            try:
+                os.unlink(SOCKET_PATH)
+            except OSError:
+                pass
+    finally:
+        lock.close()  # Only after the socket is gone
+
+if __name__ == '__main__':
+    main()
@@ -7,16 +7,95 @@ Ensures hooks are properly integrated after installation
 import json
 import os
 import sys
-from pathlib import Path
+
+# (event, matcher, hook command, timeout) - commands run from ~/.claude/hooks.
+# PostToolUse hooks go through the shared pingmem-hookd daemon.
+REGISTRATIONS = [
+    ('PostToolUse', 'Write|Edit|MultiEdit', 'pingmem-hook-client.sh memory-update', 5),
+    ('PostToolUse', 'Write|Edit|MultiEdit', 'pingmem-hook-client.sh github-issue', 5),
+    ('PostToolUse', '.*', 'pingmem-hook-client.sh github-issue', 5),
+    ('UserPromptSubmit', '.*', 'pending-issues-check.sh', 3),
+]
+
+# Python scripts earlier installs registered directly -> replacement command
+LEGACY_HOOKS = {
+    'memory-update-posttooluse.py': 'pingmem-hook-client.sh memory-update',
+    'github-issue-automation.py': 'pingmem-hook-client.sh github-issue',
+    'pending-issues-check.py': 'pending-issues-check.sh',
+}
+
+def index_hooks(settings, legacy_commands):
+    """Index hook entries by (event, matcher) in one pass over settings.
+
+    Migrates legacy commands along the way. Returns a dict mapping
+    (event, matcher) to (first hook entry, set of registered commands),
+    and a list of (event, matcher, old command, new command) migrations.
+    """
+    matcher_index = {}
+    legacy_hooks = []
+
+    for event, hook_entries in settings['hooks'].items():
+        for hook_entry in hook_entries:
+            key = (event, hook_entry.get('matcher'))
+            _, commands = matcher_index.setdefault(key, (hook_entry, set()))
+
+            for hook in hook_entry.get('hooks', []):
+                if hook.get('command') in legacy_commands:
+                    legacy_hooks.append((key, hook_entry, hook))
+                else:
+                    commands.add(hook.get('command', ''))
+
+    # Migrate once every current command is known, so a legacy hook whose
+    # replacement is already registered is dropped rather than duplicated
+    migrated = []
+
+    for key, hook_entry, hook in legacy_hooks:
+        _, commands = matcher_index[key]
+        replacement = legacy_commands[hook['command']]
+        migrated.append((*key, hook['command'], replacement))
+
+        if replacement in commands:
+            hook_entry['hooks'].remove(hook)
+        else:
+            hook['command'] = replacement
+            commands.add(replacement)
+
+    return matcher_index, migrated
+
+def ensure_hook(settings, matcher_index, event, matcher, command, timeout):
+    """Register command under (event, matcher) unless already present.
+
+    Returns True if the hook was added.
+    """
+    key = (event, matcher)
+
+    if key not in matcher_index:
+        hook_entry = {"matcher": matcher, "hooks": []}
+        settings['hooks'].setdefault(event, []).append(hook_entry)
+        matcher_index[key] = (hook_entry, set())
+
+    hook_entry, commands = matcher_index[key]
+
+    if command in commands:
+        return False
+
+    hook_entry.setdefault('hooks', []).append({
+        "type": "command",
+        "command": command,
+        "timeout": timeout
+    })
+    commands.add(command)
+    return True
 
 def register_hooks():
     """Register memory system hooks in Claude Code settings.json"""
 
-    home = Path.home()
-    settings_path = home / '.claude' / 'settings.json'
+    home = os.path.expanduser('~')
+    settings_path = f"{home}/.claude/settings.json"
+    hooks_dir = f"{home}/.claude/hooks"
 
     # Ensure settings.json exists
-    if not settings_path.exists():
+    if not os.path.exists(settings_path):
         print(f"❌ Error: {settings_path} not found")
         print("   Claude Code may not be installed")
         return False
@@ -30,149 +109,37 @@ def register_hooks():
         if 'hooks' not in settings:
             settings['hooks'] = {}
 
-        if 'PostToolUse' not in settings['hooks']:
-            settings['hooks']['PostToolUse'] = []
-
-        if 'UserPromptSubmit' not in settings['hooks']:
-            settings['hooks']['UserPromptSubmit'] = []
-
-        # Hook paths
-        memory_hook = f"python3 {home}/.claude/hooks/memory-update-posttooluse.py"
-        github_hook = f"python3 {home}/.claude/hooks/github-issue-automation.py"
-        pending_hook = f"python3 {home}/.claude/hooks/pending-issues-check.py"
-
-        # Check if already registered (avoid duplicates)
-        existing_commands = []
-        for hook_entry in settings['hooks'].get('PostToolUse', []):
-            for hook in hook_entry.get('hooks', []):
-                existing_commands.append(hook.get('command', ''))
-
-        for hook_entry in settings['hooks'].get('UserPromptSubmit', []):
-            for hook in hook_entry.get('hooks', []):
-                existing_commands.append(hook.get('command', ''))
+        legacy_commands = {
+            f"python3 {hooks_dir}/{script}": f"sh {hooks_dir}/{replacement}"
+            for script, replacement in LEGACY_HOOKS.items()
+        }
+        matcher_index, migrated = index_hooks(settings, legacy_commands)
 
         # Track what we add
         added = []
 
-        # Add PostToolUse hooks (Write|Edit|MultiEdit matcher)
-        if memory_hook not in existing_commands or github_hook not in existing_commands:
-            # Check if there's already a Write|Edit|MultiEdit matcher
-            write_matcher_exists = False
-            for hook_entry in settings['hooks']['PostToolUse']:
-                if hook_entry.get('matcher') == 'Write|Edit|MultiEdit':
-                    # Add to existing matcher
-                    if memory_hook not in existing_commands:
-                        hook_entry['hooks'].append({
-                            "type": "command",
-                            "command": memory_hook,
-                            "timeout": 5
-                        })
-                        added.append("memory-update-posttooluse.py (PostToolUse)")
-
-                    if github_hook not in existing_commands:
-                        hook_entry['hooks'].append({
-                            "type": "command",
-                            "command": github_hook,
-                            "timeout": 5
-                        })
-                        added.append("github-issue-automation.py (PostToolUse)")
-
-                    write_matcher_exists = True
-                    break
-
-            # Create new matcher if doesn't exist
-            if not write_matcher_exists:
-                new_hooks = []
-
-                if memory_hook not in existing_commands:
-                    new_hooks.append({
-                        "type": "command",
-                        "command": memory_hook,
-                        "timeout": 5
-                    })
-                    added.append("memory-update-posttooluse.py (PostToolUse)")
-
-                if github_hook not in existing_commands:
-                    new_hooks.append({
-                        "type": "command",
-                        "command": github_hook,
-                        "timeout": 5
-                    })
-                    added.append("github-issue-automation.py (PostToolUse)")
-
-                if new_hooks:
-                    settings['hooks']['PostToolUse'].append({
-                        "matcher": "Write|Edit|MultiEdit",
-                        "hooks": new_hooks
-                    })
-
-        # Add catch-all PostToolUse for issue detection
-        if github_hook not in [cmd for cmd in existing_commands if 'github-issue' in cmd]:
-            catchall_exists = False
-            for hook_entry in settings['hooks']['PostToolUse']:
-                if hook_entry.get('matcher') == '.*':
-                    # Check if github hook already there
-                    has_github = any(github_hook == h.get('command') for h in hook_entry.get('hooks', []))
-                    if not has_github:
-                        hook_entry['hooks'].append({
-                            "type": "command",
-                            "command": github_hook,
-                            "timeout": 5
-                        })
-                        added.append("github-issue-automation.py (PostToolUse catchall)")
-                    catchall_exists = True
-                    break
-
-            if not catchall_exists:
-                settings['hooks']['PostToolUse'].append({
-                    "matcher": ".*",
-                    "hooks": [{
-                        "type": "command",
-                        "command": github_hook,
-                        "timeout": 5
-                    }]
-                })
-                added.append("github-issue-automation.py (PostToolUse catchall)")
-
-        # Add UserPromptSubmit hook for pending issues
-        if pending_hook not in existing_commands:
-            # Check for existing .* matcher
-            catchall_exists = False
-            for hook_entry in settings['hooks']['UserPromptSubmit']:
-                if hook_entry.get('matcher') == '.*':
-                    # Add to existing
-                    hook_entry['hooks'].append({
-                        "type": "command",
-                        "command": pending_hook,
-                        "timeout": 3
-                    })
-                    added.append("pending-issues-check.py (UserPromptSubmit)")
-                    catchall_exists = True
-                    break
-
-            if not catchall_exists:
-                settings['hooks']['UserPromptSubmit'].append({
-                    "matcher": ".*",
-                    "hooks": [{
-                        "type": "command",
-                        "command": pending_hook,
-                        "timeout": 3
-                    }]
-                })
-                added.append("pending-issues-check.py (UserPromptSubmit)")
+        for event, matcher, hook, timeout in REGISTRATIONS:
+            command = f"sh {hooks_dir}/{hook}"
+            if ensure_hook(settings, matcher_index, event, matcher, command, timeout):
+                added.append(f"{hook} ({event} {matcher})")
 
         # Write updated settings
         with open(settings_path, 'w') as f:
             json.dump(settings, f, indent=2)
 
+        if migrated:
+            print("🔁 Migrated hooks in settings.json:")
+            for event, matcher, old, new in migrated:
+                print(f"   - {os.path.basename(old)} -> {os.path.basename(new)} ({event} {matcher})")
+
         if added:
             print("✅ Registered hooks in settings.json:")
             for hook in added:
                 print(f"   - {hook}")
-            return True
-        else:
+        elif not migrated:
             print("ℹ️  All hooks already registered in settings.json")
-            return True
+
+        return True
 
     except json.JSONDecodeError as e:
         print(f"❌ Error: Invalid JSON in {settings_path}")
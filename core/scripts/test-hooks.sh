@@ -11,6 +11,8 @@
 # 2. GitHub issue automation (PostToolUse)
 # 3. Pending issues check (UserPromptSubmit)
 # 4. Hook registration verification
+# 5. Integration verification script
+# 6. Hook daemon socket dispatch
 #
 
 set -eo pipefail
@@ -27,8 +29,8 @@ TESTS_RUN=0
 TESTS_PASSED=0
 TESTS_FAILED=0
 
-print_success() { echo -e "${GREEN}✅ $*${NC}"; ((TESTS_PASSED++)); }
-print_error() { echo -e "${RED}❌ $*${NC}"; ((TESTS_FAILED++)); }
+print_success() { echo -e "${GREEN}✅ $*${NC}"; ((++TESTS_PASSED)); }
+print_error() { echo -e "${RED}❌ $*${NC}"; ((++TESTS_FAILED)); }
 print_info() { echo -e "${BLUE}ℹ️  $*${NC}"; }
 print_header() { echo -e "${BLUE}$*${NC}"; }
 
@@ -49,7 +51,7 @@ trap cleanup EXIT
 # Test 1: Memory Update Hook
 test_memory_update() {
     print_header "🧪 Test 1: Memory Update Hook"
-    ((TESTS_RUN++))
+    ((++TESTS_RUN))
 
     # Create test project
     mkdir -p "$TEST_PROJECT_DIR/.memories"
@@ -89,7 +91,7 @@ test_memory_update() {
 # Test 2: GitHub Issue Automation
 test_github_issue_automation() {
     print_header "🧪 Test 2: GitHub Issue Automation"
-    ((TESTS_RUN++))
+    ((++TESTS_RUN))
 
     if [[ -f "$HOOKS_DIR/github-issue-automation.py" ]]; then
         cd "$TEST_PROJECT_DIR"
@@ -100,17 +102,17 @@ test_github_issue_automation() {
 
         if python3 "$HOOKS_DIR/github-issue-automation.py" 2>/dev/null; then
             # Check if issue was queued
-            if [[ -f ".memories/issue-tracking/pending-issues.json" ]]; then
-                if grep -q "Type error for testing" ".memories/issue-tracking/pending-issues.json" 2>/dev/null; then
+            if [[ -f ".memories/issue-tracking/pending-issues.jsonl" ]]; then
+                if grep -q "Type error for testing" ".memories/issue-tracking/pending-issues.jsonl" 2>/dev/null; then
                     print_success "GitHub issue automation detects errors"
 
                     # Cleanup test issue
-                    rm -f ".memories/issue-tracking/pending-issues.json"
+                    rm -f ".memories/issue-tracking/pending-issues.jsonl"
                 else
                     print_error "Issue detection didn't queue the error"
                 fi
             else
-                print_info "No pending-issues.json created (may need config)"
+                print_info "No pending-issues.jsonl created (may need config)"
             fi
         else
             print_error "GitHub issue automation failed to execute"
@@ -125,26 +127,19 @@ test_github_issue_automation() {
 # Test 3: Pending Issues Check
 test_pending_issues_check() {
     print_header "🧪 Test 3: Pending Issues Check"
-    ((TESTS_RUN++))
+    ((++TESTS_RUN))
 
-    if [[ -f "$HOOKS_DIR/pending-issues-check.py" ]]; then
+    if [[ -f "$HOOKS_DIR/pending-issues-check.sh" ]]; then
         cd "$TEST_PROJECT_DIR"
         mkdir -p ".memories/issue-tracking"
 
         # Create fake pending issue
-        cat > ".memories/issue-tracking/pending-issues.json" <<'EOF'
-[
-  {
-    "error_message": "Test error for pending check",
-    "severity": "high",
-    "category": "test-error",
-    "detected_at": "2025-10-05T12:00:00Z"
-  }
-]
+        cat > ".memories/issue-tracking/pending-issues.jsonl" <<'EOF'
+{"error_message": "Test error for pending check", "severity": "high", "category": "test-error", "file": "test.ts", "detected_at": "2025-10-05T12:00:00Z"}
 EOF
 
         # Run hook
-        if OUTPUT=$(python3 "$HOOKS_DIR/pending-issues-check.py" 2>&1); then
+        if OUTPUT=$(sh "$HOOKS_DIR/pending-issues-check.sh" 2>&1); then
             # Should output reminder with the test error
             if echo "$OUTPUT" | grep -q "PENDING GITHUB ISSUES"; then
                 print_success "Pending issues check generates reminders"
@@ -153,7 +148,7 @@ EOF
             fi
 
             # Cleanup
-            rm -f ".memories/issue-tracking/pending-issues.json"
+            rm -f ".memories/issue-tracking/pending-issues.jsonl"
         else
             print_error "Pending issues check failed to execute"
         fi
@@ -170,12 +165,13 @@ test_hook_files() {
 
     local hooks=(
         "memory-update-posttooluse.py"
+        "pingmem-hookd.py"
         "github-issue-automation.py"
-        "pending-issues-check.py"
+        "_pending-issues-check.py"
     )
 
     for hook in "${hooks[@]}"; do
-        ((TESTS_RUN++))
+        ((++TESTS_RUN))
 
         if [[ -f "$HOOKS_DIR/$hook" ]]; then
             # Check executable
@@ -198,7 +194,7 @@ test_hook_files() {
 # Test 5: Integration Script Exists
 test_integration_script() {
     print_header "🧪 Test 5: Integration Verification Script"
-    ((TESTS_RUN++))
+    ((++TESTS_RUN))
 
     if [[ -f "$REPO_ROOT/core/scripts/verify-integration.sh" ]]; then
         if [[ -x "$REPO_ROOT/core/scripts/verify-integration.sh" ]]; then
@@ -211,6 +207,117 @@ test_integration_script() {
     fi
 }
 
+# Test 6: Hook Daemon
+test_hook_daemon() {
+    print_header "🧪 Test 6: Hook Daemon"
+    ((++TESTS_RUN))
+
+    if [[ ! -f "$HOOKS_DIR/pingmem-hookd.py" ]]; then
+        print_info "Hook daemon not found (skipping)"
+        return
+    fi
+
+    if ! command -v node >/dev/null 2>&1; then
+        print_info "node not installed (skipping)"
+        return
+    fi
+
+    local daemon_dir="$TEST_PROJECT_DIR/daemon"
+    local socket="$daemon_dir/home/.claude/pingmem.sock"
+    local edit='{"tool":{"name":"Edit","args":{"file_path":"notes.md"}}}'
+
+    mkdir -p "$daemon_dir/home/.claude" "$daemon_dir/.claude/hooks" "$daemon_dir/.memories/issue-tracking"
+    CLEANUP_NEEDED=true
+    cd "$daemon_dir"
+
+    echo '{"detection":{"enabled":true}}' > ".memories/issue-tracking/config.json"
+
+    # Stand-in memory hook that records each call
+    echo 'require("fs").appendFileSync("node-calls.log", process.argv.slice(2).join(" ") + "\n")' \
+        > ".claude/hooks/memory-update-hook.js"
+
+    # Run the client as Claude Code would, with an isolated HOME so the
+    # test gets its own daemon
+    run_client() {
+        HOME="$daemon_dir/home" CLAUDE_HOOK_INPUT="$2" sh "$HOOKS_DIR/pingmem-hook-client.sh" "$1"
+    }
+
+    # Cold event: the client starts the daemon and updates directly
+    run_client memory-update "$edit"
+
+    for _ in {1..50}; do
+        [[ -S "$socket" ]] && break
+        sleep 0.1
+    done
+
+    if [[ ! -S "$socket" ]]; then
+        print_error "Hook client didn't start the daemon"
+        cd - >/dev/null
+        return
+    fi
+
+    # A second daemon must exit and leave the running one's socket alone
+    HOME="$daemon_dir/home" python3 "$HOOKS_DIR/pingmem-hookd.py" &
+    local second_pid=$!
+    sleep 0.5
+
+    if kill -0 "$second_pid" 2>/dev/null; then
+        print_error "A second hook daemon started alongside the first"
+        kill "$second_pid" 2>/dev/null || true
+    elif [[ ! -S "$socket" ]]; then
+        print_error "A second hook daemon removed the running daemon's socket"
+    else
+        print_success "Only one hook daemon runs at a time"
+    fi
+    wait "$second_pid" 2>/dev/null || true
+
+    # A malformed event must not take the daemon down
+    run_client memory-update '{"tool":"oops"}'
+
+    # Concurrent edits to one file coalesce into a single node call
+    run_client memory-update "$edit" &
+    run_client memory-update "$edit" &
+    run_client memory-update "$edit" &
+    wait
+
+    run_client github-issue '{"tool":{"name":"Write","args":{"file_path":"daemon.ts"}},"result":{"error":"error TS2345: Daemon type error"}}'
+
+    sleep 0.5
+
+    # The first call is the cold event's direct update
+    if [[ ! -S "$socket" ]]; then
+        print_error "Hook daemon exited after a malformed event"
+    elif ! grep -q "Daemon type error" ".memories/issue-tracking/pending-issues.jsonl" 2>/dev/null; then
+        print_error "Hook daemon didn't queue the github-issue event"
+    elif [[ "$(grep -c "Edit notes.md" node-calls.log 2>/dev/null)" != "2" ]]; then
+        print_error "Hook daemon didn't coalesce memory-update events into one node call"
+    else
+        print_success "Hook client dispatches events through the daemon"
+    fi
+
+    # install.sh stops the daemon this way before replacing hook files
+    python3 - "$socket" 2>/dev/null <<'EOF' || true
+import sys, socket
+client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+client.connect(sys.argv[1])
+client.sendall(b'shutdown\n\n{}')
+client.close()
+EOF
+
+    for _ in {1..20}; do
+        [[ -S "$socket" ]] || break
+        sleep 0.1
+    done
+
+    if [[ -S "$socket" ]]; then
+        print_error "Hook daemon ignored the shutdown event"
+    else
+        print_success "Hook daemon exits on shutdown event"
+    fi
+
+    cd - >/dev/null
+}
+
 # Run all tests
 echo ""
 print_header "================================================"
@@ -223,6 +330,7 @@ test_github_issue_automation
 test_pending_issues_check
 test_hook_files
 test_integration_script
+test_hook_daemon
 
 # Summary
 echo ""
@@ -36,7 +36,10 @@ HOOKS=(
   "memory-update-hook.js"
   "memory-update-posttooluse.py"
   "github-issue-automation.py"
-  "pending-issues-check.py"
+  "pingmem-hookd.py"
+  "pingmem-hook-client.sh"
+  "pending-issues-check.sh"
+  "_pending-issues-check.py"
   "memory-freshness-check.js"
 )
 
@@ -49,6 +52,13 @@ for hook in "${HOOKS[@]}"; do
   fi
 done
 
+# Optional: pingmem-hook-client.sh forwards events without starting Python
+if command -v socat >/dev/null 2>&1 || command -v perl >/dev/null 2>&1; then
+  print_success "socat or perl available for hook daemon events"
+else
+  print_warning "Neither socat nor perl found - hook events use a slower Python socket client"
+fi
+
 echo ""
 
 # =============================================================================
@@ -58,9 +68,9 @@ echo ""
 echo "⚙️  Checking settings.json Registration..."
 
 HOOK_PATTERNS=(
-  "memory-update-posttooluse.py:PostToolUse hook for memory updates"
-  "github-issue-automation.py:PostToolUse hook for issue detection"
-  "pending-issues-check.py:UserPromptSubmit hook for issue reminders"
+  "pingmem-hook-client.sh memory-update:PostToolUse hook for memory updates"
+  "pingmem-hook-client.sh github-issue:PostToolUse hook for issue detection"
+  "pending-issues-check.sh:UserPromptSubmit hook for issue reminders"
   "memory-freshness-check.js:UserPromptSubmit hook for memory freshness"
 )
 
@@ -167,18 +177,18 @@ if [ -f "$HOME/.claude/hooks/github-issue-automation.py" ]; then
     if python3 "$HOME/.claude/hooks/github-issue-automation.py" 2>/dev/null; then
 
       # Check if issue was queued
-      if [ -f ".memories/issue-tracking/pending-issues.json" ]; then
-        if grep -q "test integration" ".memories/issue-tracking/pending-issues.json"; then
+      if [ -f ".memories/issue-tracking/pending-issues.jsonl" ]; then
+        if grep -q "test integration" ".memories/issue-tracking/pending-issues.jsonl"; then
           print_success "Issue detection works end-to-end"
 
           # Cleanup test issue
-          rm -f ".memories/issue-tracking/pending-issues.json"
+          rm -f ".memories/issue-tracking/pending-issues.jsonl"
         else
           print_error "Issue detection failed to queue error"
           ((FAILURES++))
         fi
       else
-        print_error "pending-issues.json not created"
+        print_error "pending-issues.jsonl not created"
         ((FAILURES++))
       fi
     else
@@ -203,14 +213,14 @@ echo ""
 
 echo "🔔 Testing Issue Reminder..."
 
-if [ -f "$HOME/.claude/hooks/pending-issues-check.py" ]; then
+if [ -f "$HOME/.claude/hooks/pending-issues-check.sh" ]; then
   if [ -d ".memories/issue-tracking" ]; then
     # Create test pending issue
     mkdir -p ".memories/issue-tracking"
-    echo '[{"severity":"high","category":"test","error_message":"test","file":"test.ts","detected_at":"2025-01-01T00:00:00Z"}]' > ".memories/issue-tracking/pending-issues.json"
+    echo '{"severity":"high","category":"test","error_message":"test","file":"test.ts","detected_at":"2025-01-01T00:00:00Z"}' > ".memories/issue-tracking/pending-issues.jsonl"
 
     # Run reminder hook
-    if output=$(python3 "$HOME/.claude/hooks/pending-issues-check.py" 2>/dev/null); then
+    if output=$(sh "$HOME/.claude/hooks/pending-issues-check.sh" 2>/dev/null); then
       if echo "$output" | grep -q "PENDING GITHUB ISSUES"; then
         print_success "Issue reminder works end-to-end"
       else
@@ -223,12 +233,12 @@ if [ -f "$HOME/.claude/hooks/pending-issues-check.py" ]; then
     fi
 
     # Cleanup
-    rm -f ".memories/issue-tracking/pending-issues.json"
+    rm -f ".memories/issue-tracking/pending-issues.jsonl"
   else
     print_info "Issue tracking not initialized (skipping)"
   fi
 else
-  print_error "pending-issues-check.py not found"
+  print_error "pending-issues-check.sh not found"
   ((FAILURES++))
 fi
 
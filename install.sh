@@ -627,8 +627,27 @@ main() {
     if [[ "$DRY_RUN" == false ]]; then
         mkdir -p "$HOME/.claude/hooks"
 
+        # Stop a running hook daemon - it keeps the hook code it imported,
+        # so the next event must start it from the files copied below
+        if [[ -S "$HOME/.claude/pingmem.sock" ]] &&
+            python3 - "$HOME/.claude/pingmem.sock" 2>/dev/null <<'EOF'; then
+import sys, socket
+client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+client.connect(sys.argv[1])
+client.sendall(b'shutdown\n\n{}')
+client.close()
+EOF
+            print_success "Stopped running hook daemon"
+        fi
+
+        # pingmem-hook-client.sh forwards events with socat or perl
+        if ! command -v socat >/dev/null 2>&1 && ! command -v perl >/dev/null 2>&1; then
+            print_warning "Neither socat nor perl found - hook events will use a slower Python socket client"
+            print_info "Install socat for faster hooks: brew install socat / sudo apt install socat"
+        fi
+
         # Copy Python hooks
-        for hook in memory-update-posttooluse.py github-issue-automation.py pending-issues-check.py; do
+        for hook in memory-update-posttooluse.py pingmem-hookd.py pingmem-hook-client.sh github-issue-automation.py pending-issues-check.sh _pending-issues-check.py; do
             if [[ -f "$SCRIPT_DIR/core/hooks/$hook" ]]; then
                 cp "$SCRIPT_DIR/core/hooks/$hook" "$HOME/.claude/hooks/"
                 chmod +x "$HOME/.claude/hooks/$hook"